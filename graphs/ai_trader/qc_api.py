@@ -5,34 +5,87 @@ SHA256 timestamped authentication matching the TypeScript implementation.
 """
 
 import base64
+import binascii
+import functools
 import hashlib
 import os
 import time
 from typing import Any
 
 import httpx
+import orjson
 
 QC_API_URL = "https://www.quantconnect.com/api/v2"
 
+# Shared client so QC requests reuse pooled HTTP/2 connections
+_client: httpx.AsyncClient | None = None
+
+
+def get_qc_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for QuantConnect requests."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=128,
+                keepalive_expiry=300.0,
+            ),
+        )
+    return _client
+
+
+# Last (timestamp, token) generated per (user_id, api_token)
+_auth_cache: dict[tuple[str, str], tuple[str, str]] = {}
+
+
+@functools.lru_cache(maxsize=4)
+def _encode_credentials(user_id: str, api_token: str) -> tuple[bytes, bytes]:
+    """Encode the "user_id:" and "api_token:" prefixes once per credential pair."""
+    return f"{user_id}:".encode(), f"{api_token}:".encode()
+
+
+@functools.cache
+def get_qc_credentials() -> tuple[str, str, str]:
+    """
+    Read (user_id, api_token, org_id) from the environment once.
+
+    Missing values are returned as empty strings. Call
+    get_qc_credentials.cache_clear() after changing the environment.
+    """
+    return (
+        os.environ.get("QUANTCONNECT_USER_ID") or "",
+        os.environ.get("QUANTCONNECT_TOKEN") or "",
+        os.environ.get("QUANTCONNECT_ORGANIZATION_ID") or "",
+    )
+
 
 def get_qc_auth_headers() -> dict[str, str]:
     """Generate QuantConnect authentication headers with SHA256 timestamped token."""
-    user_id = os.environ.get("QUANTCONNECT_USER_ID")
-    api_token = os.environ.get("QUANTCONNECT_TOKEN")
-    org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+    user_id, api_token, org_id = get_qc_credentials()
 
     if not all([user_id, api_token, org_id]):
         raise ValueError("Missing QuantConnect credentials")
 
-    timestamp = int(time.time())
-    timestamped_token = f"{api_token}:{timestamp}"
-    hashed_token = hashlib.sha256(timestamped_token.encode()).hexdigest()
-    authentication = f"{user_id}:{hashed_token}"
-    auth_header = f"Basic {base64.b64encode(authentication.encode()).decode()}"
+    # The token only changes once a second, so reuse it within that second
+    timestamp = str(int(time.time()))
+    cached = _auth_cache.get((user_id, api_token))
+    if cached is not None and cached[0] == timestamp:
+        authentication = cached[1]
+    else:
+        user_prefix, token_prefix = _encode_credentials(user_id, api_token)
+        # Hex digest as bytes, so it feeds base64 without a str round trip
+        hashed_token = binascii.hexlify(
+            hashlib.sha256(token_prefix + timestamp.encode()).digest()
+        )
+        authentication = base64.b64encode(user_prefix + hashed_token).decode()
+        _auth_cache[(user_id, api_token)] = (timestamp, authentication)
 
     return {
-        "Authorization": auth_header,
-        "Timestamp": str(timestamp),
+        "Authorization": f"Basic {authentication}",
+        "Timestamp": timestamp,
         "Content-Type": "application/json",
     }
 
@@ -46,35 +99,35 @@ async def qc_request(
     headers = get_qc_auth_headers()
     url = f"{QC_API_URL}{endpoint}"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        if method == "GET":
-            response = await client.get(url, headers=headers)
-        else:
-            response = await client.request(
-                method, url, headers=headers, json=payload or {}
-            )
-
-        response.raise_for_status()
-
-        # Handle empty response body
-        if not response.content or response.content.strip() == b"":
-            raise Exception(f"QC API returned empty response for {endpoint}")
-
-        try:
-            data = response.json()
-        except Exception as e:
-            raise Exception(
-                f"QC API returned invalid JSON for {endpoint}: {response.text[:200]}"
-            ) from e
-
-        # Handle case where API returns a string instead of dict
-        if isinstance(data, str):
-            raise Exception(f"QC API returned unexpected string: {data}")
-
-        # Handle QC API success: false pattern
-        if isinstance(data, dict) and data.get("success") is False:
-            errors = data.get("errors", [])
-            error_msg = "; ".join(errors) if errors else data.get("error", str(data))
-            raise Exception(f"QC API error: {error_msg}")
-
-        return data
+    client = get_qc_client()
+    if method == "GET":
+        response = await client.get(url, headers=headers)
+    else:
+        response = await client.request(
+            method, url, headers=headers, json=payload or {}
+        )
+
+    response.raise_for_status()
+
+    # Handle empty response body
+    if not response.content or response.content.strip() == b"":
+        raise Exception(f"QC API returned empty response for {endpoint}")
+
+    try:
+        data = orjson.loads(response.content)
+    except Exception as e:
+        raise Exception(
+            f"QC API returned invalid JSON for {endpoint}: {response.text[:200]}"
+        ) from e
+
+    # Handle case where API returns a string instead of dict
+    if isinstance(data, str):
+        raise Exception(f"QC API returned unexpected string: {data}")
+
+    # Handle QC API success: false pattern
+    if isinstance(data, dict) and data.get("success") is False:
+        errors = data.get("errors", [])
+        error_msg = "; ".join(errors) if errors else data.get("error", str(data))
+        raise Exception(f"QC API error: {error_msg}")
+
+    return data
@@ -11,6 +11,19 @@ from typing import Any
 
 import httpx
 
+# Shared HTTP client so Supabase requests reuse pooled connections
+_http_client: httpx.AsyncClient | None = None
+
+# Service-role client shared by the tools
+_service_client: "SupabaseClient | None" = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for Supabase requests."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient()
+    return _http_client
 
 
 def get_supabase_config() -> tuple[str, str]:
@@ -33,6 +46,9 @@ class SupabaseClient:
 
         # For public tables, pass use_service_role=True
         client = SupabaseClient(use_service_role=True)
+
+        # Or reuse the shared service-role client
+        client = get_service_client()
     """
 
     def __init__(self, use_service_role: bool = False, access_token: str | None = None):
@@ -87,10 +103,55 @@ class SupabaseClient:
 
         url = f"{self.supabase_url}/rest/v1/{table}"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url, params=params, headers=self._headers())
+        response = await get_http_client().get(
+            url, params=params, headers=self._headers(), timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json() or []
+
+    async def select_with_count(
+        self,
+        table: str,
+        params: dict[str, str] = None,
+        timeout: float = 30.0,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """
+        SELECT from a table along with the total number of matching rows.
+
+        Pass "limit" and "offset" in params to fetch a single page; the
+        total still counts every row matching the filters. An offset past
+        the last row returns no rows rather than an error.
+
+        Args:
+            table: Table name
+            params: Query params (e.g., {"project_id": "eq.123", "limit": "10"})
+            timeout: Request timeout in seconds
+
+        Returns:
+            Tuple of (matching rows, total row count)
+        """
+        if not self.supabase_url:
+            raise ValueError("Supabase URL not configured")
+
+        url = f"{self.supabase_url}/rest/v1/{table}"
+        headers = self._headers()
+        headers["Prefer"] = "count=exact"
+
+        response = await get_http_client().get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        # PostgREST answers 416 when the offset is past the last row; the
+        # total is still reported in Content-Range ("*/123")
+        if response.status_code == 416:
+            rows = []
+        else:
             response.raise_for_status()
-            return response.json() or []
+            rows = response.json() or []
+
+        # Content-Range looks like "0-9/123" (or "*/0" for no rows)
+        content_range = response.headers.get("content-range", "")
+        _, _, total = content_range.partition("/")
+        return rows, int(total) if total.isdigit() else len(rows)
 
     async def insert(
         self,
@@ -116,10 +177,11 @@ class SupabaseClient:
         headers = self._headers()
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(url, json=data, headers=headers)
-            response.raise_for_status()
-            return response.json() or []
+        response = await get_http_client().post(
+            url, json=data, headers=headers, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json() or []
 
     async def update(
         self,
@@ -147,10 +209,11 @@ class SupabaseClient:
         headers = self._headers()
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.patch(url, params=match, json=data, headers=headers)
-            response.raise_for_status()
-            return response.json() or []
+        response = await get_http_client().patch(
+            url, params=match, json=data, headers=headers, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json() or []
 
     async def delete(
         self,
@@ -176,10 +239,11 @@ class SupabaseClient:
         headers = self._headers()
         headers["Prefer"] = "return=representation"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.delete(url, params=match, headers=headers)
-            response.raise_for_status()
-            return response.json() or []
+        response = await get_http_client().delete(
+            url, params=match, headers=headers, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json() or []
 
     async def rpc(
         self,
@@ -203,9 +267,16 @@ class SupabaseClient:
 
         url = f"{self.supabase_url}/rest/v1/rpc/{function_name}"
 
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                url, json=params or {}, headers=self._headers()
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await get_http_client().post(
+            url, json=params or {}, headers=self._headers(), timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+def get_service_client() -> SupabaseClient:
+    """Get or create the shared service-role Supabase client."""
+    global _service_client
+    if _service_client is None:
+        _service_client = SupabaseClient(use_service_role=True)
+    return _service_client
@@ -69,7 +69,9 @@ from .misc import (
 # Object Store
 from .object_store import (
     delete_object,
+    delete_objects,
     list_object_store_files,
+    list_object_store_files_with_properties,
     read_object_properties,
     upload_object,
 )
@@ -77,11 +79,14 @@ from .object_store import (
 # Optimization
 from .optimization import (
     abort_optimization,
+    abort_optimizations,
     create_optimization,
     delete_optimization,
+    delete_optimizations,
     estimate_optimization,
     list_optimizations,
     read_optimization,
+    read_optimizations,
     update_optimization,
 )
 
@@ -110,19 +115,24 @@ __all__ = [
     "list_backtests",
     "update_backtest",
     "delete_backtest",
-    # Optimization (7)
+    # Optimization (10)
     "estimate_optimization",
     "create_optimization",
     "read_optimization",
+    "read_optimizations",
     "list_optimizations",
     "update_optimization",
     "abort_optimization",
+    "abort_optimizations",
     "delete_optimization",
-    # Object Store (4)
+    "delete_optimizations",
+    # Object Store (6)
     "upload_object",
     "read_object_properties",
     "list_object_store_files",
+    "list_object_store_files_with_properties",
     "delete_object",
+    "delete_objects",
     # Composite (4)
     "qc_compile_and_backtest",
     "qc_compile_and_optimize",
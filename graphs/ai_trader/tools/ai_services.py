@@ -10,7 +10,7 @@ from openai import AsyncOpenAI
 
 from ..context import Context
 from ..qc_api import qc_request
-from ..supabase_client import SupabaseClient
+from ..supabase_client import get_service_client
 from ..tools.utils import format_error, format_success
 
 
@@ -264,7 +264,7 @@ async def search_local_algorithms(
         embedding = await _generate_embedding(query)
         vector_string = f"[{','.join(str(x) for x in embedding)}]"
 
-        client = SupabaseClient(use_service_role=True)
+        client = get_service_client()
         results = await client.rpc(
             "match_algorithms",
             {
@@ -333,7 +333,7 @@ async def get_algorithm_code(
         else:
             params["file_path"] = f"eq.{algorithm_id}"
 
-        client = SupabaseClient(use_service_role=True)
+        client = get_service_client()
         data = await client.select("algorithm_knowledge_base", params)
 
         if not data:
@@ -348,7 +348,7 @@ async def get_algorithm_code(
             "id": algorithm.get("id"),
             "filePath": algorithm.get("file_path"),
             "summary": algorithm.get("summary"),
-            "lines": len(code.split("\n")),
+            "lines": code.count("\n") + 1,
         }, message={"id": runtime.tool_call_id})
 
         return json.dumps(
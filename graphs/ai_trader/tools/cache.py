@@ -0,0 +1,132 @@
+"""Short-lived in-process cache for read-only tool lookups."""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+# Marks a cache miss, so lookups that return None can be cached too
+_MISS = object()
+
+
+def _nested_keys(keys: Iterable[str], prefix: str) -> list[str]:
+    """Keys equal to prefix or nested under it (prefix:...)."""
+    nested = prefix + ":"
+    return [k for k in keys if k == prefix or k.startswith(nested)]
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    Keys are strings of the form "name:arg1:arg2", which lets writers
+    drop related entries with a prefix (see invalidate).
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> None:
+        """Drop the entry for prefix and every entry nested under it."""
+        for key in _nested_keys(self._data, prefix):
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+
+# Shared by all tools so writers can invalidate entries cached by readers
+tool_cache = TTLCache()
+
+# Lookups currently running, keyed like tool_cache
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def cache_key(name: str, *args: Any) -> str:
+    """Build a cache key from a lookup name and its arguments."""
+    return ":".join([name, *map(str, args)])
+
+
+def invalidate(name: str, *args: Any) -> None:
+    """
+    Drop cached results after a write.
+
+    invalidate("list_object_store_files", org_id) drops the listings of
+    every path for that organization. Lookups still running for those
+    keys are detached, so their results are not stored.
+    """
+    prefix = cache_key(name, *args)
+    tool_cache.invalidate(prefix)
+    for key in _nested_keys(_inflight, prefix):
+        del _inflight[key]
+
+
+def cached(
+    name: str, ttl: float | Callable[[Any], float] | None = None
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Cache the result of an async lookup in tool_cache.
+
+    The key is built from name and the positional arguments, so decorated
+    functions should take only positional, string-convertible arguments.
+    Concurrent calls with the same key share a single in-flight lookup.
+    None results are cached like any other value; exceptions are not.
+
+    Args:
+        name: Key prefix for this lookup (e.g., "read_project_nodes")
+        ttl: Seconds to keep results (default: the cache's TTL), or a
+            function of the result returning seconds
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        def store(key: str, task: asyncio.Task) -> None:
+            # Checking the exception also marks it retrieved for asyncio
+            failed = task.cancelled() or task.exception() is not None
+            # A lookup detached by invalidate() may predate a write
+            if _inflight.get(key) is not task:
+                return
+            del _inflight[key]
+            if not failed:
+                value = task.result()
+                tool_cache.set(key, value, ttl(value) if callable(ttl) else ttl)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any) -> Any:
+            key = cache_key(name, *args)
+            value = tool_cache.get(key, _MISS)
+            if value is not _MISS:
+                return value
+            task = _inflight.get(key)
+            if task is None:
+                task = _inflight[key] = asyncio.ensure_future(func(*args))
+                task.add_done_callback(functools.partial(store, key))
+            # Shielded so one cancelled caller does not cancel the others
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
@@ -9,7 +9,9 @@ from langgraph.graph.ui import push_ui_message
 
 from ..context import Context
 from ..qc_api import qc_request
-from ..supabase_client import SupabaseClient
+from ..supabase_client import get_service_client
+from .cache import invalidate
+from .optimization import _ERR_INVALID_STEP, _estimated_runs, _qc_parameters
 from .utils import format_error, format_success, start_backtest_streaming
 
 
@@ -141,7 +143,7 @@ async def _save_code_version(
         return None
 
     try:
-        client = SupabaseClient(use_service_role=True)
+        client = get_service_client()
 
         # Parse statistics
         record = {
@@ -163,6 +165,7 @@ async def _save_code_version(
         }
 
         result = await client.insert("code_versions", record)
+        invalidate("get_code_versions", project_db_id)
         return result[0] if result else None
 
     except Exception:
@@ -270,6 +273,10 @@ async def qc_compile_and_optimize(
         if len(parameters) > 3:
             return format_error("QC limits optimizations to 3 parameters max.")
 
+        qc_params = _qc_parameters(parameters)
+        if any(p["step"] <= 0 for p in qc_params):
+            return _ERR_INVALID_STEP
+
         # Compile
         compile_data = await qc_request("/compile/create", {"projectId": qc_project_id})
         compile_id = compile_data.get("compileId")
@@ -302,23 +309,19 @@ async def qc_compile_and_optimize(
                 "parallelNodes": parallel_nodes,
             },
         )
+        invalidate("list_optimizations", qc_project_id)
 
         opt_id = result.get("optimizations", [{}])[0].get(
             "optimizationId"
         ) or result.get("optimizationId")
 
-        estimated_runs = 1
-        for p in parameters:
-            steps = ((p.get("max", 100) - p.get("min", 0)) // p.get("step", 1)) + 1
-            estimated_runs *= steps
-
         return json.dumps(
             {
                 "success": True,
                 "compile_id": compile_id,
                 "optimization_id": opt_id,
                 "optimization_name": optimization_name,
-                "estimated_backtests": estimated_runs,
+                "estimated_backtests": _estimated_runs(qc_params),
                 "message": f'Optimization "{optimization_name}" created! Use read_optimization with ID: {opt_id}',
             },
             indent=2,
@@ -103,7 +103,7 @@ async def qc_read_file(
             
             # Emit file-list UI
             push_ui_message("file-list", {
-                "files": [{"name": f["name"], "lines": len(f.get("content", "").split("\n"))} for f in file_list],
+                "files": [{"name": f["name"], "lines": f.get("content", "").count("\n") + 1} for f in file_list],
                 "count": len(file_list),
             }, message={"id": runtime.tool_call_id})
             
@@ -124,7 +124,7 @@ async def qc_read_file(
             "fileName": file_name,
             "content": content[:2000] if len(content) > 2000 else content,
             "truncated": len(content) > 2000,
-            "lines": len(content.split("\n")),
+            "lines": content.count("\n") + 1,
         }, message={"id": runtime.tool_call_id})
 
         return json.dumps(
@@ -174,7 +174,7 @@ async def qc_update_file(
             "fileName": file_name,
             "success": True,
             "message": f"File '{file_name}' updated successfully.",
-            "lines": len(content.split("\n")),
+            "lines": content.count("\n") + 1,
         }, message={"id": runtime.tool_call_id})
 
         return json.dumps(
@@ -1,14 +1,112 @@
 """Miscellaneous tools for QuantConnect projects."""
 
 import asyncio
-import json
+import time
 
 from langchain.tools import tool, ToolRuntime
 from langgraph.graph.ui import push_ui_message
 
 from ..context import Context
 from ..qc_api import qc_request
-from ..supabase_client import SupabaseClient
+from ..supabase_client import get_service_client
+from .cache import cached, invalidate
+from .utils import dumps
+
+# Static error responses, serialized once
+_ERR_NO_PROJECT = dumps({"error": True, "message": "No project context."})
+_ERR_NO_PROJECT_DB_ID = dumps(
+    {"error": True, "message": "Project database ID not found."}
+)
+_ERR_VERSION_ID_REQUIRED = dumps(
+    {"error": True, "message": "version_id is required."}
+)
+
+
+def _format_percent(val: float | None) -> str | None:
+    """Format a ratio like 0.125 as '12.5%'."""
+    return None if val is None else f"{val * 100:.1f}%"
+
+
+def _format_decimal(val: float | None) -> str | None:
+    """Format a number with two decimals."""
+    return None if val is None else f"{val:.2f}"
+
+
+def _format_version(version: dict, rank: int) -> dict:
+    """Format a code_versions row for the version list."""
+    get = version.get
+    return {
+        "rank": rank,
+        "id": get("id"),
+        "backtest_name": get("backtest_name") or get("name"),
+        "backtest_id": get("backtest_id"),
+        "metrics": {
+            "total_return": _format_percent(get("total_return")),
+            "sharpe_ratio": _format_decimal(get("sharpe_ratio")),
+            "max_drawdown": _format_percent(get("max_drawdown")),
+            "win_rate": _format_percent(get("win_rate")),
+            "total_trades": get("total_trades"),
+        },
+        "created_at": get("created_at"),
+    }
+
+
+@cached("get_code_versions")
+async def _fetch_code_versions(
+    project_db_id: str, page: int, page_size: int
+) -> dict:
+    """Fetch one page of formatted code versions for a project."""
+    start = (page - 1) * page_size
+
+    # Use service role key for internal DB access. Only the requested page
+    # is fetched; the total comes from the Content-Range count.
+    page_versions, total = await get_service_client().select_with_count(
+        "code_versions",
+        {
+            "select": "*",
+            "project_id": f"eq.{project_db_id}",
+            "order": "created_at.desc",
+            "limit": str(page_size),
+            "offset": str(start),
+        },
+    )
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+
+    return {
+        "pagination": {
+            "current_page": page,
+            "page_size": page_size,
+            "total_results": total,
+            "total_pages": total_pages,
+        },
+        "versions": [
+            _format_version(v, rank)
+            for rank, v in enumerate(page_versions, start=start + 1)
+        ],
+    }
+
+
+@cached("get_code_version")
+async def _fetch_code_version(version_id: int) -> dict | None:
+    """Fetch a single code version row, or None if it does not exist."""
+    # Use service role key for internal DB access
+    data = await get_service_client().select(
+        "code_versions",
+        {"select": "*", "id": f"eq.{version_id}", "limit": "1"},
+    )
+    return data[0] if data else None
+
+
+@cached("read_project_nodes")
+async def _read_project_nodes(qc_project_id: int) -> dict:
+    """Read the node configuration of a QC project."""
+    return await qc_request("/projects/nodes/read", {"projectId": qc_project_id})
+
+
+@cached("read_lean_versions")
+async def _read_lean_versions(qc_project_id: int) -> dict:
+    """Read the LEAN versions available to a QC project."""
+    return await qc_request("/lean/versions", {"projectId": qc_project_id})
 
 
 @tool
@@ -27,7 +125,8 @@ async def wait(
     # Clamp to reasonable bounds
     wait_time = max(1, min(60, seconds))
     
-    push_ui_message("wait-status", {
+    started = time.monotonic()
+    ui = push_ui_message("wait-status", {
         "seconds": wait_time,
         "reason": reason,
         "status": "waiting",
@@ -35,13 +134,13 @@ async def wait(
     
     await asyncio.sleep(wait_time)
     
+    # Update the same UI event in place rather than pushing a second one
     push_ui_message("wait-status", {
-        "seconds": wait_time,
-        "reason": reason,
         "status": "completed",
-    }, message={"id": runtime.tool_call_id})
+        "duration_ms": int((time.monotonic() - started) * 1000),
+    }, id=ui["id"], message={"id": runtime.tool_call_id}, merge=True)
     
-    return json.dumps(
+    return dumps(
         {"status": "completed", "waited_seconds": wait_time, "reason": reason}
     )
 
@@ -59,80 +158,33 @@ async def get_code_versions(
         page: Page number (default: 1)
         page_size: Results per page (default: 10, max: 20)
     """
+    # Clamp to reasonable bounds
+    page = max(1, page)
+    page_size = max(1, min(20, page_size))
+
     try:
         project_db_id = runtime.context.get("project_db_id")
         if not project_db_id:
-            return json.dumps(
-                {"error": True, "message": "Project database ID not found."}
-            )
-
-        # Use service role key for internal DB access
-        client = SupabaseClient(use_service_role=True)
-        all_versions = await client.select(
-            "code_versions",
-            {
-                "select": "*",
-                "project_id": f"eq.{project_db_id}",
-                "order": "created_at.desc",
-            },
-        )
+            return _ERR_NO_PROJECT_DB_ID
 
-        total = len(all_versions)
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_versions = all_versions[start:end]
-
-        def format_percent(val):
-            return f"{val * 100:.1f}%" if val is not None else None
-
-        def format_decimal(val):
-            return f"{val:.2f}" if val is not None else None
-
-        versions = []
-        for i, v in enumerate(page_versions):
-            versions.append(
-                {
-                    "rank": start + i + 1,
-                    "id": v.get("id"),
-                    "backtest_name": v.get("backtest_name") or v.get("name"),
-                    "backtest_id": v.get("backtest_id"),
-                    "metrics": {
-                        "total_return": format_percent(v.get("total_return")),
-                        "sharpe_ratio": format_decimal(v.get("sharpe_ratio")),
-                        "max_drawdown": format_percent(v.get("max_drawdown")),
-                        "win_rate": format_percent(v.get("win_rate")),
-                        "total_trades": v.get("total_trades"),
-                    },
-                    "created_at": v.get("created_at"),
-                }
-            )
+        result = await _fetch_code_versions(project_db_id, page, page_size)
+        versions = result["versions"]
+        pagination = result["pagination"]
 
         # Emit code versions list UI
         push_ui_message("code-versions-list", {
             "versions": versions[:5],
             "pagination": {
                 "currentPage": page,
-                "totalPages": total_pages,
-                "totalResults": total,
+                "totalPages": pagination["total_pages"],
+                "totalResults": pagination["total_results"],
             },
         }, message={"id": runtime.tool_call_id})
 
-        return json.dumps(
-            {
-                "pagination": {
-                    "current_page": page,
-                    "page_size": page_size,
-                    "total_results": total,
-                    "total_pages": total_pages,
-                },
-                "versions": versions,
-            },
-            indent=2,
-        )
+        return dumps(result, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to get code versions: {e!s}"}
         )
 
@@ -150,22 +202,16 @@ async def get_code_version(
     """
     try:
         if not version_id:
-            return json.dumps({"error": True, "message": "version_id is required."})
-
-        # Use service role key for internal DB access
-        client = SupabaseClient(use_service_role=True)
-        data = await client.select(
-            "code_versions",
-            {"select": "*", "id": f"eq.{version_id}", "limit": "1"},
-        )
+            return _ERR_VERSION_ID_REQUIRED
 
-        if not data:
-            return json.dumps(
+        version = await _fetch_code_version(version_id)
+        if version is None:
+            return dumps(
                 {"error": True, "message": f"Code version {version_id} not found."}
             )
 
-        version = data[0]
-        
+        code = version.get("code") or ""
+
         # Emit code version UI
         push_ui_message("code-version-detail", {
             "id": version.get("id"),
@@ -173,13 +219,13 @@ async def get_code_version(
             "backtestId": version.get("backtest_id"),
             "totalReturn": version.get("total_return"),
             "sharpeRatio": version.get("sharpe_ratio"),
-            "lines": len(version.get("code", "").split("\n")) if version.get("code") else 0,
+            "lines": code.count("\n") + 1 if code else 0,
         }, message={"id": runtime.tool_call_id})
 
-        return json.dumps(version, indent=2)
+        return dumps(version, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to get code version: {e!s}"}
         )
 
@@ -190,20 +236,20 @@ async def read_project_nodes(runtime: ToolRuntime[Context]) -> str:
     try:
         qc_project_id = runtime.context.get("qc_project_id")
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
-        result = await qc_request("/projects/nodes/read", {"projectId": qc_project_id})
+        result = await _read_project_nodes(qc_project_id)
         
-        nodes = result.get("nodes", [])
+        nodes = result.get("nodes") or []
         push_ui_message("project-nodes", {
-            "nodes": nodes[:10] if nodes else [],
+            "nodes": nodes[:10],
             "count": len(nodes),
         }, message={"id": runtime.tool_call_id})
         
-        return json.dumps(result, indent=2)
+        return dumps(result, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to read project nodes: {e!s}"}
         )
 
@@ -222,11 +268,12 @@ async def update_project_nodes(
     try:
         qc_project_id = runtime.context.get("qc_project_id")
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
         await qc_request(
             "/projects/nodes/update", {"projectId": qc_project_id, "nodes": nodes}
         )
+        invalidate("read_project_nodes", qc_project_id)
         
         push_ui_message("project-nodes-update", {
             "success": True,
@@ -234,12 +281,12 @@ async def update_project_nodes(
             "message": f"Updated project nodes: {', '.join(nodes)}",
         }, message={"id": runtime.tool_call_id})
         
-        return json.dumps(
+        return dumps(
             {"success": True, "message": f"Updated project nodes: {nodes}"}
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to update project nodes: {e!s}"}
         )
 
@@ -250,20 +297,20 @@ async def read_lean_versions(runtime: ToolRuntime[Context]) -> str:
     try:
         qc_project_id = runtime.context.get("qc_project_id")
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
-        result = await qc_request("/lean/versions", {"projectId": qc_project_id})
+        result = await _read_lean_versions(qc_project_id)
         
-        versions = result.get("versions", [])
+        versions = result.get("versions") or []
         push_ui_message("lean-versions", {
-            "versions": versions[:10] if versions else [],
+            "versions": versions[:10],
             "count": len(versions),
         }, message={"id": runtime.tool_call_id})
         
-        return json.dumps(result, indent=2)
+        return dumps(result, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to read LEAN versions: {e!s}"}
         )
 
@@ -1,17 +1,108 @@
 """Object store tools for QuantConnect."""
 
-import base64
+import asyncio
 import hashlib
-import json
-import os
-import time
+import io
+from typing import Any
 
 import httpx
+import orjson
 from langchain.tools import tool, ToolRuntime
-from langgraph.graph.ui import push_ui_message
 
 from ..context import Context
-from ..qc_api import qc_request
+from ..qc_api import (
+    QC_API_URL,
+    get_qc_auth_headers,
+    get_qc_client,
+    get_qc_credentials,
+    qc_request,
+)
+from .cache import cache_key, cached, invalidate, tool_cache
+from .utils import dumps, emit_ui
+
+# Static error responses, serialized once
+_ERR_NO_ORG_ID = dumps(
+    {"error": True, "message": "Missing QUANTCONNECT_ORGANIZATION_ID."}
+)
+_ERR_NO_CREDENTIALS = dumps({"error": True, "message": "Missing QC credentials."})
+_ERR_KEY_AND_CONTENT_REQUIRED = dumps(
+    {"error": True, "message": "key and content are required."}
+)
+
+# How long an upload is remembered, so identical re-uploads can be skipped
+UPLOAD_DEDUPE_TTL = 300.0
+
+# Cap on concurrent QC requests when a tool batches object store calls
+OBJECT_STORE_CONCURRENCY = 10
+
+
+def _parse_json(response: httpx.Response) -> dict:
+    """Decode a JSON response body, or wrap non-JSON text as {"raw": ...}."""
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return orjson.loads(response.content)
+    return {"raw": response.text}
+
+
+def _ui_objects(objects: list[dict]) -> list[dict]:
+    """Key and size of the first ten objects, for the object-store-list UI."""
+    # Only the ten previewed rows are touched, however long the listing is
+    return [{"key": o.get("key"), "size": o.get("size")} for o in objects[:10]]
+
+
+@cached("read_object_properties")
+async def _read_object_properties(org_id: str, key: str) -> dict:
+    """Read the metadata of one object store file."""
+    return await qc_request(
+        "/object/properties", {"organizationId": org_id, "key": key}
+    )
+
+
+@cached("list_object_store_files")
+async def _list_objects(org_id: str, path: str) -> dict:
+    """List object store files under a path."""
+    return await qc_request("/object/list", {"organizationId": org_id, "path": path})
+
+
+async def _set_object(org_id: str, key: str, payload: bytes) -> Any | None:
+    """Upload one object, returning QC's errors on failure or None on success."""
+    # Same auth as qc_request; httpx sets the multipart Content-Type
+    headers = get_qc_auth_headers()
+    del headers["Content-Type"]
+
+    # Stream the part from a buffer rather than one in-memory body
+    files = {
+        "objectData": (
+            key,
+            io.BytesIO(payload),
+            "application/octet-stream",
+        )
+    }
+    data = {"organizationId": org_id, "key": key}
+
+    # Reuse the pooled QC client rather than a new connection per upload
+    response = await get_qc_client().post(
+        f"{QC_API_URL}/object/set",
+        headers=headers,
+        data=data,
+        files=files,
+    )
+
+    result = _parse_json(response)
+
+    if not response.is_success or result.get("success") is False:
+        return result.get("errors") or response.text
+
+    invalidate("list_object_store_files", org_id)
+    invalidate("read_object_properties", org_id, key)
+    return None
+
+
+async def _delete_object(org_id: str, key: str) -> None:
+    """Delete one object and drop the cached lookups that mention it."""
+    await qc_request("/object/delete", {"organizationId": org_id, "key": key})
+    invalidate("list_object_store_files", org_id)
+    invalidate("read_object_properties", org_id, key)
+    invalidate("upload_object", org_id, key)
 
 
 @tool
@@ -19,6 +110,7 @@ async def upload_object(
     key: str,
     content: str,
     runtime: ToolRuntime[Context],
+    force: bool = False,
 ) -> str:
     """
     Upload data to QuantConnect object store.
@@ -26,73 +118,60 @@ async def upload_object(
     Args:
         key: Object key/name (use .txt for readable content)
         content: Content to upload
+        force: Upload even if this exact content was just uploaded to the key
+            (e.g., to restore it after a backtest overwrote it)
     """
     try:
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
-        user_id = os.environ.get("QUANTCONNECT_USER_ID")
-        api_token = os.environ.get("QUANTCONNECT_TOKEN")
+        user_id, api_token, org_id = get_qc_credentials()
 
         if not all([org_id, user_id, api_token]):
-            return json.dumps({"error": True, "message": "Missing QC credentials."})
+            return _ERR_NO_CREDENTIALS
 
         if not key or not content:
-            return json.dumps(
-                {"error": True, "message": "key and content are required."}
+            return _ERR_KEY_AND_CONTENT_REQUIRED
+
+        # Encode once; the same bytes feed the upload and the reported size
+        payload = content.encode()
+
+        # Skip the network call when this exact content was just uploaded.
+        # Backtests and other clients can write the key too, so the result
+        # says so and force=True always uploads.
+        digest = hashlib.sha256(payload).hexdigest()
+        upload_key = cache_key("upload_object", org_id, key)
+        unchanged = not force and tool_cache.get(upload_key) == digest
+        if unchanged:
+            message = (
+                f"Skipped upload of {key}: identical content was uploaded "
+                "moments ago. Use force=True if it may have been overwritten since."
             )
-
-        # Generate auth headers
-        timestamp = int(time.time())
-        timestamped_token = f"{api_token}:{timestamp}"
-        hashed_token = hashlib.sha256(timestamped_token.encode()).hexdigest()
-        auth_string = f"{user_id}:{hashed_token}"
-        auth_header = f"Basic {base64.b64encode(auth_string.encode()).decode()}"
-
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            files = {"objectData": (key, content.encode(), "application/octet-stream")}
-            data = {"organizationId": org_id, "key": key}
-
-            response = await client.post(
-                "https://www.quantconnect.com/api/v2/object/set",
-                headers={"Authorization": auth_header, "Timestamp": str(timestamp)},
-                data=data,
-                files=files,
-            )
-
-            result = (
-                response.json()
-                if response.headers.get("content-type", "").startswith(
-                    "application/json"
-                )
-                else {"raw": response.text}
-            )
-
-            if not response.is_success or result.get("success") is False:
-                return json.dumps(
-                    {
-                        "error": True,
-                        "message": f"Upload failed: {result.get('errors', response.text)}",
-                    }
-                )
+        else:
+            error = await _set_object(org_id, key, payload)
+            if error is not None:
+                return dumps({"error": True, "message": f"Upload failed: {error}"})
+            tool_cache.set(upload_key, digest, UPLOAD_DEDUPE_TTL)
+            message = f"Successfully uploaded object: {key}"
 
         # Emit object-store UI
-        push_ui_message("object-store-operation", {
+        emit_ui("object-store-operation", {
             "operation": "upload",
             "key": key,
             "success": True,
-            "size": len(content),
-            "message": f"Successfully uploaded object: {key}",
-        }, message={"id": runtime.tool_call_id})
+            "unchanged": unchanged,
+            "size": len(payload),
+            "message": message,
+        }, runtime.tool_call_id)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
-                "message": f"Successfully uploaded object: {key}",
+                "unchanged": unchanged,
+                "message": message,
                 "key": key,
             }
         )
 
     except Exception as e:
-        return json.dumps({"error": True, "message": f"Failed to upload object: {e!s}"})
+        return dumps({"error": True, "message": f"Failed to upload object: {e!s}"})
 
 
 @tool
@@ -107,27 +186,23 @@ async def read_object_properties(
         key: Object key to read properties for
     """
     try:
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+        _, _, org_id = get_qc_credentials()
         if not org_id:
-            return json.dumps(
-                {"error": True, "message": "Missing QUANTCONNECT_ORGANIZATION_ID."}
-            )
+            return _ERR_NO_ORG_ID
 
-        data = await qc_request(
-            "/object/properties", {"organizationId": org_id, "key": key}
-        )
+        data = await _read_object_properties(org_id, key)
         
         # Emit object properties UI
-        push_ui_message("object-store-properties", {
+        emit_ui("object-store-properties", {
             "key": key,
             "size": data.get("size"),
             "modified": data.get("modified"),
-        }, message={"id": runtime.tool_call_id})
+        }, runtime.tool_call_id)
         
-        return json.dumps(data, indent=2)
+        return dumps(data, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to read object properties: {e!s}"}
         )
 
@@ -144,28 +219,98 @@ async def list_object_store_files(
         path: Optional path to list (e.g., "/folder1"). Empty for root.
     """
     try:
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+        _, _, org_id = get_qc_credentials()
         if not org_id:
-            return json.dumps(
-                {"error": True, "message": "Missing QUANTCONNECT_ORGANIZATION_ID."}
-            )
+            return _ERR_NO_ORG_ID
 
-        data = await qc_request(
-            "/object/list", {"organizationId": org_id, "path": path or ""}
-        )
+        data = await _list_objects(org_id, path or "")
         
         objects = data.get("objects", [])
         # Emit object store list UI
-        push_ui_message("object-store-list", {
+        emit_ui("object-store-list", {
             "path": path or "/",
-            "objects": [{"key": o.get("key"), "size": o.get("size")} for o in objects[:10]],
+            "objects": _ui_objects(objects),
             "count": len(objects),
-        }, message={"id": runtime.tool_call_id})
+        }, runtime.tool_call_id)
         
-        return json.dumps(data, indent=2)
+        return dumps(data, pretty=True)
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
+            {"error": True, "message": f"Failed to list object store files: {e!s}"}
+        )
+
+
+@tool
+async def list_object_store_files_with_properties(
+    runtime: ToolRuntime[Context],
+    path: str = "",
+    limit: int = 20,
+) -> str:
+    """
+    List object store files together with each file's metadata.
+    Use this instead of calling read_object_properties for every listed key.
+    Folders are skipped.
+
+    Args:
+        path: Optional path to list (e.g., "/folder1"). Empty for root.
+        limit: Max files to read properties for (default: 20, max: 50)
+    """
+    # Clamp to reasonable bounds
+    limit = max(1, min(50, limit))
+
+    try:
+        _, _, org_id = get_qc_credentials()
+        if not org_id:
+            return _ERR_NO_ORG_ID
+
+        data = await _list_objects(org_id, path or "")
+        objects = [o for o in data.get("objects", []) if not o.get("folder")]
+        total = len(objects)
+        objects = objects[:limit]
+
+        semaphore = asyncio.Semaphore(OBJECT_STORE_CONCURRENCY)
+
+        async def fetch(key: str) -> dict:
+            # Reuse cached reads, but keep the batch out of the shared cache
+            props = tool_cache.get(cache_key("read_object_properties", org_id, key))
+            if props is not None:
+                return props
+            async with semaphore:
+                return await qc_request(
+                    "/object/properties", {"organizationId": org_id, "key": key}
+                )
+
+        properties = await asyncio.gather(
+            *(fetch(o.get("key")) for o in objects), return_exceptions=True
+        )
+
+        files = []
+        for obj, props in zip(objects, properties, strict=True):
+            if isinstance(props, Exception):
+                files.append({**obj, "properties_error": str(props)})
+            else:
+                files.append({**obj, "properties": props})
+
+        # Emit object store list UI
+        emit_ui("object-store-list", {
+            "path": path or "/",
+            "objects": _ui_objects(files),
+            "count": total,
+        }, runtime.tool_call_id)
+
+        return dumps(
+            {
+                "path": path or "/",
+                "total_files": total,
+                "truncated": total > len(files),
+                "objects": files,
+            },
+            pretty=True,
+        )
+
+    except Exception as e:
+        return dumps(
             {"error": True, "message": f"Failed to list object store files: {e!s}"}
         )
 
@@ -182,29 +327,92 @@ async def delete_object(
         key: Object key to delete
     """
     try:
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+        _, _, org_id = get_qc_credentials()
         if not org_id:
-            return json.dumps(
-                {"error": True, "message": "Missing QUANTCONNECT_ORGANIZATION_ID."}
-            )
+            return _ERR_NO_ORG_ID
 
-        await qc_request("/object/delete", {"organizationId": org_id, "key": key})
+        await _delete_object(org_id, key)
         
         # Emit object-store delete UI
-        push_ui_message("object-store-operation", {
+        emit_ui("object-store-operation", {
             "operation": "delete",
             "key": key,
             "success": True,
             "message": f"Successfully deleted object: {key}",
-        }, message={"id": runtime.tool_call_id})
+        }, runtime.tool_call_id)
         
-        return json.dumps(
+        return dumps(
             {"success": True, "message": f"Successfully deleted object: {key}"}
         )
 
     except Exception as e:
-        return json.dumps({"error": True, "message": f"Failed to delete object: {e!s}"})
+        return dumps({"error": True, "message": f"Failed to delete object: {e!s}"})
+
+
+@tool
+async def delete_objects(
+    keys: list[str],
+    runtime: ToolRuntime[Context],
+) -> str:
+    """
+    Delete several objects from the QuantConnect object store at once.
+    Use this instead of calling delete_object for every key.
+
+    Args:
+        keys: Object keys to delete
+    """
+    try:
+        _, _, org_id = get_qc_credentials()
+        if not org_id:
+            return _ERR_NO_ORG_ID
+
+        semaphore = asyncio.Semaphore(OBJECT_STORE_CONCURRENCY)
+
+        async def delete(key: str) -> None:
+            async with semaphore:
+                await _delete_object(org_id, key)
+
+        results = await asyncio.gather(
+            *(delete(k) for k in keys), return_exceptions=True
+        )
+
+        deleted = []
+        failed = []
+        for key, result in zip(keys, results, strict=True):
+            if isinstance(result, Exception):
+                failed.append({"key": key, "error": str(result)})
+            else:
+                deleted.append(key)
+
+        message = f"Deleted {len(deleted)} of {len(keys)} objects"
+
+        # Emit object-store delete UI
+        emit_ui("object-store-operation", {
+            "operation": "delete",
+            "key": ", ".join(deleted),
+            "success": not failed,
+            "message": message,
+        }, runtime.tool_call_id)
+
+        return dumps(
+            {
+                "success": not failed,
+                "message": message,
+                "deleted": deleted,
+                "failed": failed,
+            }
+        )
+
+    except Exception as e:
+        return dumps({"error": True, "message": f"Failed to delete objects: {e!s}"})
 
 
 # Export all tools
-TOOLS = [upload_object, read_object_properties, list_object_store_files, delete_object]
+TOOLS = [
+    upload_object,
+    read_object_properties,
+    list_object_store_files,
+    list_object_store_files_with_properties,
+    delete_object,
+    delete_objects,
+]
@@ -1,13 +1,146 @@
 """Optimization tools for QuantConnect."""
 
-import json
-import os
+import asyncio
+import heapq
+import math
+import operator
 
 from langchain.tools import tool, ToolRuntime
-from langgraph.graph.ui import push_ui_message
 
 from ..context import Context
-from ..qc_api import qc_request
+from ..qc_api import get_qc_credentials, qc_request
+from .cache import cached, invalidate
+from .utils import dumps, emit_ui
+
+# QC statistics indices (from their docs):
+# [0]=alpha, [1]=annual std dev, [2]=annual variance, [3]=avg loss%, [4]=avg win%,
+# [5]=beta, [6]=cagr%, [7]=drawdown%, [8]=estimated capacity, [9]=expectancy,
+# [10]=info ratio, [11]=loss rate%, [12]=net profit%, [13]=probabilistic sharpe,
+# [14]=profit-loss ratio, [15]=sharpe ratio, [16]=total fees, [17]=total orders,
+# [18]=tracking error, [19]=treynor ratio, [20]=win rate%
+# NOTE: QC returns stats as a dict with string keys ("0", "1", etc.), not a list!
+STAT_INDICES = {
+    "alpha": "0",
+    "annual_std_dev": "1",
+    "cagr": "6",
+    "drawdown": "7",
+    "net_profit": "12",
+    "sharpe_ratio": "15",
+    "total_trades": "17",
+    "win_rate": "20",
+}
+# Same indices as ints, for integer-keyed dicts and list-format stats
+_STAT_INT_INDICES = {key: int(idx) for key, idx in STAT_INDICES.items()}
+
+# Static error responses, serialized once
+_ERR_NO_PROJECT = dumps({"error": True, "message": "No project context."})
+_ERR_TOO_MANY_PARAMETERS = dumps(
+    {"error": True, "message": "QC limits optimizations to 3 parameters max."}
+)
+_ERR_INVALID_STEP = dumps(
+    {"error": True, "message": "Every parameter step must be greater than 0."}
+)
+
+# Constraint operators, keyed by lowercase name without "_", "-" or spaces
+OPERATOR_MAP = {
+    "less": "Less",
+    "lessorequal": "LessOrEqual",
+    "greater": "Greater",
+    "greaterorequal": "GreaterOrEqual",
+    "equals": "Equals",
+    "notequal": "NotEqual",
+}
+_OPERATOR_STRIP = str.maketrans("", "", "_- ")
+
+# Seconds to reuse an optimization read; short so polling still sees progress
+OPTIMIZATION_CACHE_TTL = 5.0
+# Finished optimizations no longer change, so they can be kept longer
+FINISHED_OPTIMIZATION_CACHE_TTL = 60.0
+_FINISHED_STATUSES = {"completed", "aborted"}
+
+# Max concurrent QC requests issued by the batch optimization tools
+OPTIMIZATION_CONCURRENCY = 8
+
+
+def _get_stat(stats_obj, key):
+    """Extract a statistic from the QC stats dict/list."""
+    if not stats_obj:
+        return None
+    idx = STAT_INDICES.get(key)
+    if idx is None:
+        return None
+    # QC returns dict with string keys like {"0": 0.123, "1": 0.456, ...}
+    # (compare to None so a legitimate 0.0 is not treated as missing)
+    if isinstance(stats_obj, dict):
+        val = stats_obj.get(idx)
+        return val if val is not None else stats_obj.get(_STAT_INT_INDICES[key])
+    # Fallback: handle as list (just in case)
+    if isinstance(stats_obj, list):
+        int_idx = _STAT_INT_INDICES[key]
+        if int_idx < len(stats_obj):
+            return stats_obj[int_idx]
+    return None
+
+
+# Statistics shown for each ranked backtest, in display order
+_ROW_STATS = ("net_profit", "cagr", "sharpe_ratio", "drawdown", "win_rate")
+_get_row_stats = operator.itemgetter(*(STAT_INDICES[key] for key in _ROW_STATS))
+
+
+def _row_stats(stats_obj) -> tuple:
+    """Extract the _ROW_STATS values of one backtest in a single lookup."""
+    if isinstance(stats_obj, dict):
+        try:
+            values = _get_row_stats(stats_obj)
+        except KeyError:
+            pass
+        else:
+            if None not in values:
+                return values
+    # Missing values or list statistics: fall back to per-statistic lookups
+    return tuple(_get_stat(stats_obj, key) for key in _ROW_STATS)
+
+
+def _pct(val):
+    """Format a percentage statistic like 12.345 as '12.35%'."""
+    return f"{val:.2f}%" if val is not None else None
+
+
+def _num3(val):
+    """Format a ratio statistic with three decimals."""
+    return f"{val:.3f}" if val is not None else None
+
+
+def _get_sharpe(bt):
+    """Sharpe ratio of a backtest as a float, for ranking."""
+    # Memoized on the backtest, since cached reads are ranked once per page
+    sharpe = bt.get("_sharpe")
+    if sharpe is None:
+        val = _get_stat(bt.get("statistics", {}), "sharpe_ratio")
+        sharpe = bt["_sharpe"] = float(val or 0)
+    return sharpe
+
+
+def _qc_parameters(parameters: list[dict]) -> list[dict]:
+    """Resolve the min/max/step defaults of each parameter config."""
+    return [
+        {
+            "name": p["name"],
+            "min": p.get("min", 0),
+            "max": p.get("max", 100),
+            "step": p.get("step", 1),
+        }
+        for p in parameters
+    ]
+
+
+def _estimated_runs(qc_params: list[dict]) -> int:
+    """Number of backtests a grid search over resolved parameters will run."""
+    # True division plus a small tolerance, since float steps undercount
+    # with floor division (0.9 // 0.1 == 8.0)
+    return math.prod(
+        math.floor((p["max"] - p["min"]) / p["step"] + 1e-9) + 1 for p in qc_params
+    )
 
 
 @tool
@@ -29,26 +162,17 @@ async def estimate_optimization(
     """
     try:
         qc_project_id = runtime.context.get("qc_project_id")
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+        _, _, org_id = get_qc_credentials()
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
-        qc_params = [
-            {
-                "name": p["name"],
-                "min": p.get("min", 0),
-                "max": p.get("max", 100),
-                "step": p.get("step", 1),
-            }
-            for p in parameters
-        ]
+        qc_params = _qc_parameters(parameters)
+        if any(p["step"] <= 0 for p in qc_params):
+            return _ERR_INVALID_STEP
 
         # Calculate estimated backtests
-        estimated_runs = 1
-        for p in parameters:
-            steps = ((p.get("max", 100) - p.get("min", 0)) // p.get("step", 1)) + 1
-            estimated_runs *= steps
+        estimated_runs = _estimated_runs(qc_params)
 
         result = await qc_request(
             "/optimizations/estimate",
@@ -63,7 +187,7 @@ async def estimate_optimization(
         )
 
         estimate = result.get("estimate", {})
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "compile_id": compile_id,
@@ -73,11 +197,11 @@ async def estimate_optimization(
                 "parallel_nodes": parallel_nodes,
                 "qc_estimate": estimate,
             },
-            indent=2,
+            pretty=True,
         )
 
     except Exception as e:
-        return json.dumps({"error": True, "message": f"Failed to estimate: {e!s}"})
+        return dumps({"error": True, "message": f"Failed to estimate: {e!s}"})
 
 
 @tool
@@ -107,41 +231,26 @@ async def create_optimization(
     """
     try:
         qc_project_id = runtime.context.get("qc_project_id")
-        org_id = os.environ.get("QUANTCONNECT_ORGANIZATION_ID")
+        _, _, org_id = get_qc_credentials()
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
         if len(parameters) > 3:
-            return json.dumps(
-                {
-                    "error": True,
-                    "message": "QC limits optimizations to 3 parameters max.",
-                }
-            )
+            return _ERR_TOO_MANY_PARAMETERS
+
+        qc_params = _qc_parameters(parameters)
+        if any(p["step"] <= 0 for p in qc_params):
+            return _ERR_INVALID_STEP
 
         # Transform constraint operators
-        operator_map = {
-            "less": "Less",
-            "lessorequal": "LessOrEqual",
-            "greater": "Greater",
-            "greaterorequal": "GreaterOrEqual",
-            "equals": "Equals",
-            "notequal": "NotEqual",
-        }
         transformed_constraints = []
         for c in constraints or []:
-            op = (
-                c.get("operator", "")
-                .lower()
-                .replace("_", "")
-                .replace("-", "")
-                .replace(" ", "")
-            )
+            op = c.get("operator", "").lower().translate(_OPERATOR_STRIP)
             transformed_constraints.append(
                 {
                     "target": c["target"],
-                    "operator": operator_map.get(op, c["operator"]),
+                    "operator": OPERATOR_MAP.get(op, c["operator"]),
                     "targetValue": c["targetValue"],
                 }
             )
@@ -163,18 +272,16 @@ async def create_optimization(
                 "parallelNodes": parallel_nodes,
             },
         )
+        invalidate("list_optimizations", qc_project_id)
 
         opt_id = result.get("optimizations", [{}])[0].get(
             "optimizationId"
         ) or result.get("optimizationId")
 
         # Calculate estimated runs
-        estimated_runs = 1
-        for p in parameters:
-            steps = ((p.get("max", 100) - p.get("min", 0)) // p.get("step", 1)) + 1
-            estimated_runs *= steps
+        estimated_runs = _estimated_runs(qc_params)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "optimization_id": opt_id,
@@ -186,15 +293,147 @@ async def create_optimization(
                 "status": "running",
                 "message": f'Optimization "{optimization_name}" created! Use read_optimization with ID: {opt_id}',
             },
-            indent=2,
+            pretty=True,
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to create optimization: {e!s}"}
         )
 
 
+def _optimization_ttl(opt: dict | str) -> float:
+    """How long to cache an optimization read, based on its status."""
+    status = opt.get("status", "") if isinstance(opt, dict) else ""
+    if str(status).lower() in _FINISHED_STATUSES:
+        return FINISHED_OPTIMIZATION_CACHE_TTL
+    return OPTIMIZATION_CACHE_TTL
+
+
+@cached("list_optimizations", ttl=OPTIMIZATION_CACHE_TTL)
+async def _list_optimizations(qc_project_id: int) -> dict:
+    """List the optimizations of a QC project."""
+    return await qc_request("/optimizations/list", {"projectId": qc_project_id})
+
+
+@cached("read_optimization", ttl=_optimization_ttl)
+async def _fetch_optimization(optimization_id: str) -> dict | str:
+    """Read an optimization from QC, returning its "optimization" field."""
+    # QC API only needs optimizationId for read (not projectId)
+    result = await qc_request(
+        "/optimizations/read",
+        {"optimizationId": optimization_id},
+    )
+    return result.get("optimization", {})
+
+
+def _summarize_optimization(
+    optimization_id: str, opt: dict, page: int, page_size: int
+) -> dict:
+    """Build the tool result for one optimization, ranking backtests by Sharpe."""
+    # backtests can be dict (keyed by id) or list. The values view is
+    # ranked directly, since nlargest/sorted/max all accept any iterable.
+    backtests_raw = opt.get("backtests", {})
+    if isinstance(backtests_raw, dict):
+        all_backtests = backtests_raw.values()
+    elif isinstance(backtests_raw, list):
+        all_backtests = backtests_raw
+    else:
+        all_backtests = []
+
+    # Sort by Sharpe ratio
+    total = len(all_backtests)
+    total_pages = (total + page_size - 1) // page_size if total > 0 else 1
+    start = (page - 1) * page_size
+    end = start + page_size
+
+    # A full ranking is memoized on the (cached) optimization, so paging
+    # through a finished sweep sorts it only once
+    ranked_all = opt.get("_ranked")
+
+    if ranked_all is not None:
+        page_results = ranked_all[start:end]
+        best_bt = ranked_all[0] if ranked_all else None
+    elif start >= total:
+        # Past the last page: nothing to rank, only the best result is needed
+        page_results = []
+        best_bt = max(all_backtests, key=_get_sharpe) if all_backtests else None
+    else:
+        # Early pages only need the top `end` backtests, not a full sort
+        if end < total // 2:
+            ranked_bt = heapq.nlargest(end, all_backtests, key=_get_sharpe)
+        else:
+            ranked_bt = opt["_ranked"] = sorted(
+                all_backtests, key=_get_sharpe, reverse=True
+            )
+        page_results = ranked_bt[start:end]
+        best_bt = ranked_bt[0]
+
+    # Format results - get_stat handles both dict and list formats
+    results = []
+    for i, bt in enumerate(page_results):
+        stats = bt.get("statistics", {})
+        params = bt.get("parameterSet", bt.get("parameters", {}))
+        
+        net_profit, cagr, sharpe, drawdown, win_rate = _row_stats(stats)
+
+        results.append({
+            "rank": start + i + 1,
+            "parameters": params,
+            "net_profit": _pct(net_profit),
+            "cagr": _pct(cagr),
+            "sharpe_ratio": _num3(sharpe),
+            "max_drawdown": _pct(drawdown),
+            "win_rate": _pct(win_rate),
+        })
+
+    # Best result - on the first page it is already formatted as results[0]
+    best = None
+    if start == 0 and results:
+        top = results[0]
+        best = {
+            "parameters": top["parameters"],
+            "net_profit": top["net_profit"],
+            "cagr": top["cagr"],
+            "sharpe_ratio": top["sharpe_ratio"],
+        }
+    elif best_bt is not None:
+        best_stats = best_bt.get("statistics", {})
+        best_params = best_bt.get("parameterSet", best_bt.get("parameters", {}))
+        
+        net_profit = _get_stat(best_stats, 'net_profit')
+        cagr = _get_stat(best_stats, 'cagr')
+        sharpe = _get_stat(best_stats, 'sharpe_ratio')
+        
+        best = {
+            "parameters": best_params,
+            "net_profit": _pct(net_profit),
+            "cagr": _pct(cagr),
+            "sharpe_ratio": _num3(sharpe),
+        }
+
+    # Runtime stats from QC
+    runtime_stats = opt.get("runtimeStatistics", {})
+
+    return {
+        "optimization_id": optimization_id,
+        "name": opt.get("name", "Unknown"),
+        "status": opt.get("status", "Unknown"),
+        "completed": runtime_stats.get("Completed", "0"),
+        "total": runtime_stats.get("Total", "0"),
+        "failed": runtime_stats.get("Failed", "0"),
+        "best_result": best,
+        "pagination": {
+            "current_page": page,
+            "page_size": page_size,
+            "total_results": total,
+            "total_pages": total_pages,
+            "has_more_pages": page < total_pages,
+        },
+        "results": results,
+    }
+
+
 @tool
 async def read_optimization(
     optimization_id: str,
@@ -210,168 +449,107 @@ async def read_optimization(
         page: Page number (default: 1)
         page_size: Results per page (default: 20, max: 50)
     """
-    # QC statistics indices (from their docs):
-    # [0]=alpha, [1]=annual std dev, [2]=annual variance, [3]=avg loss%, [4]=avg win%,
-    # [5]=beta, [6]=cagr%, [7]=drawdown%, [8]=estimated capacity, [9]=expectancy,
-    # [10]=info ratio, [11]=loss rate%, [12]=net profit%, [13]=probabilistic sharpe,
-    # [14]=profit-loss ratio, [15]=sharpe ratio, [16]=total fees, [17]=total orders,
-    # [18]=tracking error, [19]=treynor ratio, [20]=win rate%
-    # NOTE: QC returns stats as a dict with string keys ("0", "1", etc.), not a list!
-    STAT_INDICES = {
-        "alpha": "0",
-        "annual_std_dev": "1",
-        "cagr": "6",
-        "drawdown": "7",
-        "net_profit": "12",
-        "sharpe_ratio": "15",
-        "total_trades": "17",
-        "win_rate": "20",
-    }
-    
-    def get_stat(stats_obj, key):
-        """Extract a statistic from the QC stats dict/list."""
-        if not stats_obj:
-            return None
-        idx = STAT_INDICES.get(key)
-        if idx is None:
-            return None
-        # QC returns dict with string keys like {"0": 0.123, "1": 0.456, ...}
-        if isinstance(stats_obj, dict):
-            return stats_obj.get(idx) or stats_obj.get(int(idx))
-        # Fallback: handle as list (just in case)
-        if isinstance(stats_obj, list):
-            int_idx = int(idx)
-            if int_idx < len(stats_obj):
-                return stats_obj[int_idx]
-        return None
-    
+    # Clamp to reasonable bounds
+    page = max(1, page)
+    page_size = max(1, min(50, page_size))
+
     try:
         qc_project_id = runtime.context.get("qc_project_id")
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
-
-        # QC API only needs optimizationId for read (not projectId)
-        result = await qc_request(
-            "/optimizations/read",
-            {"optimizationId": optimization_id},
-        )
+            return _ERR_NO_PROJECT
 
-        opt = result.get("optimization", {})
+        opt = await _fetch_optimization(optimization_id)
         if isinstance(opt, str):
-             return json.dumps({"error": True, "message": f"Unexpected API response: optimization field is a string ({opt}). Check ID."})
-
-        # backtests can be dict (keyed by id) or list - normalize to list
-        backtests_raw = opt.get("backtests", {})
-        if isinstance(backtests_raw, dict):
-            all_backtests = list(backtests_raw.values())
-        elif isinstance(backtests_raw, list):
-            all_backtests = backtests_raw
-        else:
-            all_backtests = []
+             return dumps({"error": True, "message": f"Unexpected API response: optimization field is a string ({opt}). Check ID."})
 
-        # Sort by Sharpe ratio using get_stat helper
-        def get_sharpe(bt):
-            stats = bt.get("statistics", {})
-            val = get_stat(stats, "sharpe_ratio")
-            return float(val or 0)
-        
-        sorted_bt = sorted(all_backtests, key=get_sharpe, reverse=True)
-
-        total = len(sorted_bt)
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 1
-        start = (page - 1) * page_size
-        end = start + page_size
-        page_results = sorted_bt[start:end]
-
-        # Format results - get_stat handles both dict and list formats
-        results = []
-        for i, bt in enumerate(page_results):
-            stats = bt.get("statistics", {})
-            params = bt.get("parameterSet", bt.get("parameters", {}))
-            
-            net_profit = get_stat(stats, 'net_profit')
-            cagr = get_stat(stats, 'cagr')
-            sharpe = get_stat(stats, 'sharpe_ratio')
-            drawdown = get_stat(stats, 'drawdown')
-            win_rate = get_stat(stats, 'win_rate')
-            
-            results.append({
-                "rank": start + i + 1,
-                "parameters": params,
-                "net_profit": f"{net_profit:.2f}%" if net_profit is not None else None,
-                "cagr": f"{cagr:.2f}%" if cagr is not None else None,
-                "sharpe_ratio": f"{sharpe:.3f}" if sharpe is not None else None,
-                "max_drawdown": f"{drawdown:.2f}%" if drawdown is not None else None,
-                "win_rate": f"{win_rate:.2f}%" if win_rate is not None else None,
-            })
-
-        # Best result
-        best = None
-        if sorted_bt:
-            best_bt = sorted_bt[0]
-            best_stats = best_bt.get("statistics", [])
-            best_params = best_bt.get("parameterSet", best_bt.get("parameters", {}))
-            
-            net_profit = get_stat(best_stats, 'net_profit')
-            cagr = get_stat(best_stats, 'cagr')
-            sharpe = get_stat(best_stats, 'sharpe_ratio')
-            
-            best = {
-                "parameters": best_params,
-                "net_profit": f"{net_profit:.2f}%" if net_profit is not None else None,
-                "cagr": f"{cagr:.2f}%" if cagr is not None else None,
-                "sharpe_ratio": f"{sharpe:.3f}" if sharpe is not None else None,
-            }
-
-        # Runtime stats from QC
-        runtime_stats = opt.get("runtimeStatistics", {})
+        summary = _summarize_optimization(optimization_id, opt, page, page_size)
+        pagination = summary["pagination"]
 
         # Build UI-friendly data structure
         ui_data = {
             "optimizationId": optimization_id,
-            "name": opt.get("name", "Unknown"),
-            "status": opt.get("status", "Unknown"),
-            "progress": runtime_stats.get("Completed", "0") + "/" + runtime_stats.get("Total", "0"),
-            "bestResult": best,
+            "name": summary["name"],
+            "status": summary["status"],
+            "progress": f"{summary['completed']}/{summary['total']}",
+            "bestResult": summary["best_result"],
             "pagination": {
                 "currentPage": page,
                 "pageSize": page_size,
-                "totalResults": total,
-                "totalPages": total_pages,
-                "hasMorePages": page < total_pages,
+                "totalResults": pagination["total_results"],
+                "totalPages": pagination["total_pages"],
+                "hasMorePages": pagination["has_more_pages"],
             },
-            "results": results,
+            "results": summary["results"],
         }
         
         # Emit optimization results UI component via generative UI (linked to tool call message)
-        push_ui_message("optimization-results", ui_data, message={"id": runtime.tool_call_id})
+        emit_ui("optimization-results", ui_data, runtime.tool_call_id)
 
-        return json.dumps(
-            {
-                "optimization_id": optimization_id,
-                "name": opt.get("name", "Unknown"),
-                "status": opt.get("status", "Unknown"),
-                "completed": runtime_stats.get("Completed", "0"),
-                "total": runtime_stats.get("Total", "0"),
-                "failed": runtime_stats.get("Failed", "0"),
-                "best_result": best,
-                "pagination": {
-                    "current_page": page,
-                    "page_size": page_size,
-                    "total_results": total,
-                    "total_pages": total_pages,
-                    "has_more_pages": page < total_pages,
-                },
-                "results": results,
+        return dumps(summary, pretty=True)
 
-            },
-            indent=2,
+    except Exception as e:
+        return dumps(
+            {"error": True, "message": f"Failed to read optimization: {e!s}"}
         )
 
+
+@tool
+async def read_optimizations(
+    optimization_ids: list[str],
+    runtime: ToolRuntime[Context],
+    page_size: int = 5,
+) -> str:
+    """
+    Read the status and top results of several optimizations at once.
+    Use this instead of calling read_optimization for each ID.
+
+    Args:
+        optimization_ids: The optimization IDs to read
+        page_size: Top results to include per optimization (default: 5, max: 50)
+    """
+    # Clamp to reasonable bounds
+    page_size = max(1, min(50, page_size))
+
+    try:
+        qc_project_id = runtime.context.get("qc_project_id")
+
+        if not qc_project_id:
+            return _ERR_NO_PROJECT
+
+        semaphore = asyncio.Semaphore(OPTIMIZATION_CONCURRENCY)
+
+        async def fetch(optimization_id: str) -> dict | str:
+            async with semaphore:
+                return await _fetch_optimization(optimization_id)
+
+        opts = await asyncio.gather(
+            *(fetch(oid) for oid in optimization_ids), return_exceptions=True
+        )
+
+        optimizations = []
+        for optimization_id, opt in zip(optimization_ids, opts, strict=True):
+            if isinstance(opt, Exception):
+                optimizations.append(
+                    {"optimization_id": optimization_id, "error": str(opt)}
+                )
+            elif isinstance(opt, str):
+                optimizations.append(
+                    {
+                        "optimization_id": optimization_id,
+                        "error": f"Unexpected API response: optimization field is a string ({opt}). Check ID.",
+                    }
+                )
+            else:
+                optimizations.append(
+                    _summarize_optimization(optimization_id, opt, 1, page_size)
+                )
+
+        return dumps({"optimizations": optimizations}, pretty=True)
+
     except Exception as e:
-        return json.dumps(
-            {"error": True, "message": f"Failed to read optimization: {e!s}"}
+        return dumps(
+            {"error": True, "message": f"Failed to read optimizations: {e!s}"}
         )
 
 
@@ -388,16 +566,17 @@ async def list_optimizations(
         page: Page number (default: 1)
         page_size: Results per page (default: 10, max: 20)
     """
+    # Clamp to reasonable bounds
+    page = max(1, page)
+    page_size = max(1, min(20, page_size))
+
     try:
         qc_project_id = runtime.context.get("qc_project_id")
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
-        result = await qc_request(
-            "/optimizations/list",
-            {"projectId": qc_project_id},
-        )
+        result = await _list_optimizations(qc_project_id)
 
         all_opts = result.get("optimizations", [])
         total = len(all_opts)
@@ -418,7 +597,7 @@ async def list_optimizations(
                 }
             )
 
-        return json.dumps(
+        return dumps(
             {
                 "pagination": {
                     "current_page": page,
@@ -429,11 +608,11 @@ async def list_optimizations(
                 },
                 "optimizations": optimizations,
             },
-            indent=2,
+            pretty=True,
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to list optimizations: {e!s}"}
         )
 
@@ -455,7 +634,7 @@ async def update_optimization(
         qc_project_id = runtime.context.get("qc_project_id")
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
         await qc_request(
             "/optimizations/update",
@@ -465,8 +644,10 @@ async def update_optimization(
                 "name": name,
             },
         )
+        invalidate("read_optimization", optimization_id)
+        invalidate("list_optimizations", qc_project_id)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "message": f'Updated optimization name to "{name}"',
@@ -475,7 +656,7 @@ async def update_optimization(
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to update optimization: {e!s}"}
         )
 
@@ -495,14 +676,16 @@ async def abort_optimization(
         qc_project_id = runtime.context.get("qc_project_id")
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
         await qc_request(
             "/optimizations/abort",
             {"projectId": qc_project_id, "optimizationId": optimization_id},
         )
+        invalidate("read_optimization", optimization_id)
+        invalidate("list_optimizations", qc_project_id)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "message": f"Aborted optimization {optimization_id}. Completed backtests are preserved.",
@@ -511,7 +694,7 @@ async def abort_optimization(
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to abort optimization: {e!s}"}
         )
 
@@ -531,14 +714,16 @@ async def delete_optimization(
         qc_project_id = runtime.context.get("qc_project_id")
 
         if not qc_project_id:
-            return json.dumps({"error": True, "message": "No project context."})
+            return _ERR_NO_PROJECT
 
         await qc_request(
             "/optimizations/delete",
             {"projectId": qc_project_id, "optimizationId": optimization_id},
         )
+        invalidate("read_optimization", optimization_id)
+        invalidate("list_optimizations", qc_project_id)
 
-        return json.dumps(
+        return dumps(
             {
                 "success": True,
                 "message": f"Deleted optimization {optimization_id} and all results.",
@@ -547,18 +732,128 @@ async def delete_optimization(
         )
 
     except Exception as e:
-        return json.dumps(
+        return dumps(
             {"error": True, "message": f"Failed to delete optimization: {e!s}"}
         )
 
 
+async def _apply_to_optimizations(
+    endpoint: str, qc_project_id: int, optimization_ids: list[str]
+) -> tuple[list[str], list[dict]]:
+    """
+    Send the same request for each optimization concurrently.
+
+    Returns the IDs that succeeded and an error entry for each failure.
+    """
+    semaphore = asyncio.Semaphore(OPTIMIZATION_CONCURRENCY)
+
+    async def apply(optimization_id: str) -> None:
+        async with semaphore:
+            await qc_request(
+                endpoint,
+                {"projectId": qc_project_id, "optimizationId": optimization_id},
+            )
+        invalidate("read_optimization", optimization_id)
+
+    results = await asyncio.gather(
+        *(apply(oid) for oid in optimization_ids), return_exceptions=True
+    )
+    invalidate("list_optimizations", qc_project_id)
+
+    succeeded = []
+    failed = []
+    for optimization_id, result in zip(optimization_ids, results, strict=True):
+        if isinstance(result, Exception):
+            failed.append({"optimization_id": optimization_id, "error": str(result)})
+        else:
+            succeeded.append(optimization_id)
+    return succeeded, failed
+
+
+@tool
+async def abort_optimizations(
+    optimization_ids: list[str],
+    runtime: ToolRuntime[Context],
+) -> str:
+    """
+    Abort several running optimizations at once. Completed backtests will be kept.
+    Use this instead of calling abort_optimization for each ID.
+
+    Args:
+        optimization_ids: The optimization IDs to abort
+    """
+    try:
+        qc_project_id = runtime.context.get("qc_project_id")
+
+        if not qc_project_id:
+            return _ERR_NO_PROJECT
+
+        aborted, failed = await _apply_to_optimizations(
+            "/optimizations/abort", qc_project_id, optimization_ids
+        )
+
+        return dumps(
+            {
+                "success": not failed,
+                "message": f"Aborted {len(aborted)} of {len(optimization_ids)} optimizations. Completed backtests are preserved.",
+                "aborted": aborted,
+                "failed": failed,
+            }
+        )
+
+    except Exception as e:
+        return dumps(
+            {"error": True, "message": f"Failed to abort optimizations: {e!s}"}
+        )
+
+
+@tool
+async def delete_optimizations(
+    optimization_ids: list[str],
+    runtime: ToolRuntime[Context],
+) -> str:
+    """
+    Delete several optimizations and all their results at once. This cannot be undone.
+    Use this instead of calling delete_optimization for each ID.
+
+    Args:
+        optimization_ids: The optimization IDs to delete
+    """
+    try:
+        qc_project_id = runtime.context.get("qc_project_id")
+
+        if not qc_project_id:
+            return _ERR_NO_PROJECT
+
+        deleted, failed = await _apply_to_optimizations(
+            "/optimizations/delete", qc_project_id, optimization_ids
+        )
+
+        return dumps(
+            {
+                "success": not failed,
+                "message": f"Deleted {len(deleted)} of {len(optimization_ids)} optimizations and all results.",
+                "deleted": deleted,
+                "failed": failed,
+            }
+        )
+
+    except Exception as e:
+        return dumps(
+            {"error": True, "message": f"Failed to delete optimizations: {e!s}"}
+        )
+
+
 # Export all tools
 TOOLS = [
     estimate_optimization,
     create_optimization,
     read_optimization,
+    read_optimizations,
     list_optimizations,
     update_optimization,
     abort_optimization,
+    abort_optimizations,
     delete_optimization,
+    delete_optimizations,
 ]
@@ -2,10 +2,15 @@
 
 import asyncio
 import json
-from typing import Callable, Awaitable
+from typing import Any, Callable, Awaitable
 
+import orjson
+import structlog
 from langchain_core.runnables import RunnableConfig
 from langgraph.config import get_stream_writer
+from langgraph.graph.ui import push_ui_message
+
+logger = structlog.getLogger(__name__)
 
 
 def get_qc_project_id(config: RunnableConfig) -> int | None:
@@ -17,6 +22,36 @@ def get_qc_project_id(config: RunnableConfig) -> int | None:
     return config.get("configurable", {}).get("qc_project_id")
 
 
+def dumps(obj: Any, pretty: bool = False) -> str:
+    """
+    Serialize a tool response to a JSON string using orjson.
+
+    Args:
+        obj: The object to serialize
+        pretty: Indent the output with two spaces
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+
+
+def emit_ui(name: str, props: dict[str, Any], tool_call_id: str) -> None:
+    """
+    Emit a generative UI message attached to a tool call.
+
+    UI messages are written to graph state, so they must be sent inline
+    within the run rather than scheduled for later. A failed emit is logged
+    and never turns a successful tool call into an error.
+
+    Args:
+        name: UI component name (e.g., "object-store-list")
+        props: Props passed to the component
+        tool_call_id: ID of the tool call the message belongs to
+    """
+    try:
+        push_ui_message(name, props, message={"id": tool_call_id})
+    except Exception:
+        logger.warning("Failed to emit UI message", ui_name=name, exc_info=True)
+
+
 def format_error(message: str, details: dict | None = None) -> str:
     """
     Format an error response for the agent.
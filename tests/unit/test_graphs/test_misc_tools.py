@@ -0,0 +1,92 @@
+"""Unit tests for the ai_trader misc tools"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from graphs.ai_trader import supabase_client
+from graphs.ai_trader.tools import misc
+from graphs.ai_trader.tools.cache import tool_cache
+
+
+@pytest.fixture
+def code_versions(monkeypatch):
+    """Serve code_versions from a mock Supabase and record each request"""
+    monkeypatch.setenv("SUPABASE_URL", "https://supabase.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+    monkeypatch.setattr(supabase_client, "_service_client", None)
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(
+            206,
+            json=[{"id": 7, "name": "v7", "sharpe_ratio": 1.234}],
+            headers={"Content-Range": "0-0/3"},
+        )
+
+    monkeypatch.setattr(
+        supabase_client,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    tool_cache.clear()
+    with patch.object(misc, "push_ui_message"):
+        yield requests
+    tool_cache.clear()
+
+
+def make_runtime():
+    """ToolRuntime stand-in with a project context"""
+    runtime = MagicMock()
+    runtime.context = {"project_db_id": "project-1"}
+    runtime.tool_call_id = "call-1"
+    return runtime
+
+
+class TestGetCodeVersions:
+    """Test get_code_versions"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("page", "page_size", "expected"),
+        [
+            (0, 10, (1, 10)),
+            (-3, 0, (1, 1)),
+            (2, -5, (2, 1)),
+            (1, 500, (1, 20)),
+        ],
+    )
+    async def test_clamps_page_and_page_size(
+        self, code_versions, page, page_size, expected
+    ):
+        """Test out-of-range page and page_size are clamped before querying"""
+        result = json.loads(
+            await misc.get_code_versions.coroutine(
+                runtime=make_runtime(), page=page, page_size=page_size
+            )
+        )
+
+        expected_page, expected_size = expected
+        assert result["pagination"]["current_page"] == expected_page
+        assert result["pagination"]["page_size"] == expected_size
+        params = code_versions[0].url.params
+        assert params["limit"] == str(expected_size)
+        assert params["offset"] == str((expected_page - 1) * expected_size)
+
+    @pytest.mark.asyncio
+    async def test_pagination_uses_total_count(self, code_versions):
+        """Test ranks and page counts come from the Content-Range total"""
+        result = json.loads(
+            await misc.get_code_versions.coroutine(
+                runtime=make_runtime(), page=2, page_size=1
+            )
+        )
+
+        assert result["pagination"]["total_results"] == 3
+        assert result["pagination"]["total_pages"] == 3
+        assert [v["rank"] for v in result["versions"]] == [2]
+        assert result["versions"][0]["metrics"]["sharpe_ratio"] == "1.23"
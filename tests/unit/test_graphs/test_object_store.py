@@ -0,0 +1,126 @@
+"""Unit tests for the ai_trader object store tools"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from graphs.ai_trader import qc_api
+from graphs.ai_trader.tools import object_store, utils
+from graphs.ai_trader.tools.cache import tool_cache
+
+
+@pytest.fixture
+def qc(monkeypatch):
+    """Serve the QC object store API from a mock and record each request"""
+    monkeypatch.setenv("QUANTCONNECT_USER_ID", "user")
+    monkeypatch.setenv("QUANTCONNECT_TOKEN", "token")
+    monkeypatch.setenv("QUANTCONNECT_ORGANIZATION_ID", "org")
+    qc_api.get_qc_credentials.cache_clear()
+
+    state = {"requests": [], "fail_uploads": False}
+
+    def handler(request):
+        state["requests"].append(request.url.path.removeprefix("/api/v2"))
+        if state["fail_uploads"]:
+            return httpx.Response(
+                200, json={"success": False, "errors": ["Storage quota exceeded"]}
+            )
+        return httpx.Response(200, json={"success": True})
+
+    monkeypatch.setattr(
+        qc_api, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    tool_cache.clear()
+    with patch.object(utils, "push_ui_message"):
+        yield state
+    tool_cache.clear()
+    qc_api.get_qc_credentials.cache_clear()
+
+
+def make_runtime():
+    """ToolRuntime stand-in"""
+    runtime = MagicMock()
+    runtime.tool_call_id = "call-1"
+    return runtime
+
+
+async def upload(key, content, force=False):
+    """Call upload_object and decode its result"""
+    result = await object_store.upload_object.coroutine(
+        key=key, content=content, runtime=make_runtime(), force=force
+    )
+    return json.loads(result)
+
+
+class TestUploadObject:
+    """Test upload_object skips repeated identical uploads"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_upload_is_skipped(self, qc):
+        """Test uploading the same content twice calls QC once"""
+        first = await upload("params.json", '{"fast": 10}')
+        second = await upload("params.json", '{"fast": 10}')
+
+        assert first["success"] is True
+        assert first["unchanged"] is False
+        assert second["success"] is True
+        assert second["unchanged"] is True
+        assert "force=True" in second["message"]
+        assert qc["requests"] == ["/object/set"]
+
+    @pytest.mark.asyncio
+    async def test_same_content_to_another_key_uploads(self, qc):
+        """Test the digest is remembered per key"""
+        await upload("a.json", "{}")
+        result = await upload("b.json", "{}")
+
+        assert result["unchanged"] is False
+        assert qc["requests"] == ["/object/set"] * 2
+
+    @pytest.mark.asyncio
+    async def test_force_reuploads(self, qc):
+        """Test force=True uploads identical content again"""
+        await upload("params.json", '{"fast": 10}')
+        result = await upload("params.json", '{"fast": 10}', force=True)
+
+        assert result["unchanged"] is False
+        assert qc["requests"] == ["/object/set"] * 2
+
+    @pytest.mark.asyncio
+    async def test_changed_payload_replaces_digest(self, qc):
+        """Test new content uploads and the previous content is no longer skipped"""
+        await upload("params.json", '{"fast": 10}')
+        changed = await upload("params.json", '{"fast": 20}')
+        restored = await upload("params.json", '{"fast": 10}')
+
+        assert changed["unchanged"] is False
+        assert restored["unchanged"] is False
+        assert qc["requests"] == ["/object/set"] * 3
+
+    @pytest.mark.asyncio
+    async def test_delete_clears_digest(self, qc):
+        """Test content uploaded again after delete_object is not skipped"""
+        await upload("params.json", '{"fast": 10}')
+        deleted = await object_store.delete_object.coroutine(
+            key="params.json", runtime=make_runtime()
+        )
+        result = await upload("params.json", '{"fast": 10}')
+
+        assert "error" not in json.loads(deleted)
+        assert result["unchanged"] is False
+        assert qc["requests"] == ["/object/set", "/object/delete", "/object/set"]
+
+    @pytest.mark.asyncio
+    async def test_failed_upload_is_not_remembered(self, qc):
+        """Test a rejected upload is retried rather than skipped"""
+        qc["fail_uploads"] = True
+        failed = await upload("params.json", '{"fast": 10}')
+        qc["fail_uploads"] = False
+        retried = await upload("params.json", '{"fast": 10}')
+
+        assert failed["error"] is True
+        assert "Storage quota exceeded" in failed["message"]
+        assert retried["unchanged"] is False
+        assert qc["requests"] == ["/object/set"] * 2
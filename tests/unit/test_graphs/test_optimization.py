@@ -0,0 +1,254 @@
+"""Unit tests for the ai_trader optimization tools"""
+
+import copy
+import json
+import random
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from graphs.ai_trader.tools import composite, optimization
+from graphs.ai_trader.tools.optimization import (
+    _ERR_INVALID_STEP,
+    _estimated_runs,
+    _qc_parameters,
+    _summarize_optimization,
+)
+
+
+def make_runtime():
+    """ToolRuntime stand-in with a project context"""
+    runtime = MagicMock()
+    runtime.context = {"qc_project_id": 123}
+    runtime.tool_call_id = "call-1"
+    return runtime
+
+
+def param(min_value, max_value, step, name="p"):
+    """Parameter config as passed to the optimization tools"""
+    return {"name": name, "min": min_value, "max": max_value, "step": step}
+
+
+class TestEstimatedRuns:
+    """Test _estimated_runs"""
+
+    @pytest.mark.parametrize(
+        ("min_value", "max_value", "step", "expected"),
+        [
+            (0.0, 1.0, 0.1, 11),
+            (0.0, 0.9, 0.1, 10),
+            (0.0, 0.9, 0.3, 4),
+            (0.1, 1.0, 0.9, 2),
+            (1.5, 3.0, 0.3, 6),
+            (0.5, 1.0, 0.3, 2),
+        ],
+    )
+    def test_fractional_steps(self, min_value, max_value, step, expected):
+        """Test fractional steps count every grid point over a float range"""
+        params = _qc_parameters([param(min_value, max_value, step)])
+        assert _estimated_runs(params) == expected
+
+    @pytest.mark.parametrize(
+        ("min_value", "max_value", "step", "expected"),
+        [
+            (0, 100, 1, 101),
+            (10, 50, 10, 5),
+            (0, 10, 3, 4),
+            (5, 5, 1, 1),
+        ],
+    )
+    def test_integer_ranges(self, min_value, max_value, step, expected):
+        """Test integer ranges include both ends of the range"""
+        params = _qc_parameters([param(min_value, max_value, step)])
+        assert _estimated_runs(params) == expected
+
+    def test_multiplies_parameters(self):
+        """Test the grid size is the product over all parameters"""
+        params = _qc_parameters(
+            [param(0, 10, 5, "fast"), param(0.0, 0.9, 0.3, "slow"), {"name": "d"}]
+        )
+        assert _estimated_runs(params) == 3 * 4 * 101
+
+    def test_parameter_defaults(self):
+        """Test missing min/max/step resolve to 0/100/1"""
+        assert _qc_parameters([{"name": "p"}]) == [param(0, 100, 1)]
+
+
+class TestStepValidation:
+    """Test tools reject parameter steps that are not positive"""
+
+    @pytest.fixture(autouse=True)
+    def qc_credentials(self):
+        with patch.object(
+            optimization, "get_qc_credentials", return_value=("user", "token", "org")
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("step", [0, -1, -0.5])
+    async def test_estimate_optimization(self, step):
+        """Test estimate_optimization returns the invalid step error"""
+        with patch.object(optimization, "qc_request", AsyncMock()) as qc_request:
+            result = await optimization.estimate_optimization.coroutine(
+                compile_id="c-1",
+                parameters=[param(0, 10, 1, "a"), param(0, 10, step, "b")],
+                runtime=make_runtime(),
+            )
+
+        assert result == _ERR_INVALID_STEP
+        qc_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("step", [0, -1, -0.5])
+    async def test_create_optimization(self, step):
+        """Test create_optimization returns the invalid step error"""
+        with patch.object(optimization, "qc_request", AsyncMock()) as qc_request:
+            result = await optimization.create_optimization.coroutine(
+                compile_id="c-1",
+                optimization_name="SPY EMA - Optimizing fast",
+                target="TotalPerformance.PortfolioStatistics.SharpeRatio",
+                target_to="max",
+                parameters=[param(0, 10, step)],
+                runtime=make_runtime(),
+            )
+
+        assert result == _ERR_INVALID_STEP
+        qc_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("step", [0, -1, -0.5])
+    async def test_compile_and_optimize_rejects_before_compiling(self, step):
+        """Test qc_compile_and_optimize returns the error without compiling"""
+        with patch.object(composite, "qc_request", AsyncMock()) as qc_request:
+            result = await composite.qc_compile_and_optimize.coroutine(
+                optimization_name="SPY EMA - Optimizing fast",
+                target="TotalPerformance.PortfolioStatistics.SharpeRatio",
+                target_to="max",
+                parameters=[param(0, 10, step)],
+                runtime=make_runtime(),
+            )
+
+        assert result == _ERR_INVALID_STEP
+        qc_request.assert_not_awaited()
+
+
+class TestCompileAndOptimize:
+    """Test qc_compile_and_optimize"""
+
+    @pytest.mark.asyncio
+    async def test_estimates_fractional_steps(self):
+        """Test estimated_backtests uses the shared grid estimate"""
+        qc_request = AsyncMock(
+            side_effect=[
+                {"compileId": "c-1"},
+                {"optimizations": [{"optimizationId": "o-1"}]},
+            ]
+        )
+        with (
+            patch.object(composite, "qc_request", qc_request),
+            patch.object(
+                composite, "_poll_compile", AsyncMock(return_value=(True, None))
+            ),
+        ):
+            result = await composite.qc_compile_and_optimize.coroutine(
+                optimization_name="SPY EMA - Optimizing fast",
+                target="TotalPerformance.PortfolioStatistics.SharpeRatio",
+                target_to="max",
+                parameters=[param(0.0, 0.9, 0.1, "a"), param(10, 50, 10, "b")],
+                runtime=make_runtime(),
+            )
+
+        data = json.loads(result)
+        assert data["optimization_id"] == "o-1"
+        assert data["estimated_backtests"] == 10 * 5
+
+
+def make_optimization(count, as_list=False):
+    """Finished optimization with shuffled, partly tied Sharpe ratios"""
+    rng = random.Random(count)
+    backtests = {}
+    for i in range(count):
+        stats = {"6": rng.uniform(-5, 20), "7": rng.uniform(0, 30), "12": i * 1.5}
+        # Some ties and some backtests without a Sharpe ratio
+        if i % 7:
+            stats["15"] = round(rng.uniform(-1, 3), 1)
+        backtests[f"bt-{i}"] = {"parameterSet": {"fast": i}, "statistics": stats}
+    return {
+        "name": "SPY EMA",
+        "status": "completed",
+        "backtests": list(backtests.values()) if as_list else backtests,
+    }
+
+
+def full_ranking(opt):
+    """Reference ranking: a plain full sort by Sharpe ratio"""
+    backtests = opt["backtests"]
+    if isinstance(backtests, dict):
+        backtests = backtests.values()
+    return sorted(
+        backtests,
+        key=lambda bt: float(bt["statistics"].get("15") or 0),
+        reverse=True,
+    )
+
+
+class TestSummarizeOptimizationPaging:
+    """Test _summarize_optimization pages match a full sort"""
+
+    def assert_page_matches(self, summary, expected, page, page_size):
+        start = (page - 1) * page_size
+        expected_page = expected[start : start + page_size]
+
+        assert [r["parameters"] for r in summary["results"]] == [
+            bt["parameterSet"] for bt in expected_page
+        ]
+        assert [r["rank"] for r in summary["results"]] == list(
+            range(start + 1, start + len(expected_page) + 1)
+        )
+        assert summary["best_result"]["parameters"] == expected[0]["parameterSet"]
+        assert summary["best_result"]["sharpe_ratio"] == (
+            f"{expected[0]['statistics']['15']:.3f}"
+        )
+
+    @pytest.mark.parametrize("as_list", [False, True])
+    @pytest.mark.parametrize(("count", "page_size"), [(40, 5), (41, 7), (9, 20)])
+    def test_each_page_on_fresh_reads(self, count, page_size, as_list):
+        """Test every page, read without a memoized ranking, matches the sort"""
+        opt = make_optimization(count, as_list)
+        expected = full_ranking(copy.deepcopy(opt))
+        total_pages = -(-count // page_size)
+
+        # One page past the end only reports the best result
+        for page in range(1, total_pages + 2):
+            summary = _summarize_optimization(
+                "o-1", copy.deepcopy(opt), page, page_size
+            )
+
+            self.assert_page_matches(summary, expected, page, page_size)
+            assert summary["pagination"]["total_results"] == count
+            assert summary["pagination"]["total_pages"] == total_pages
+            assert summary["pagination"]["has_more_pages"] == (page < total_pages)
+
+    @pytest.mark.parametrize("as_list", [False, True])
+    def test_paging_one_cached_read(self, as_list):
+        """Test paging through one read reuses a ranking that matches the sort"""
+        opt = make_optimization(40, as_list)
+        expected = full_ranking(copy.deepcopy(opt))
+
+        # Early pages take the top-k path and leave no memoized ranking
+        _summarize_optimization("o-1", opt, 1, 5)
+        assert "_ranked" not in opt
+
+        # Forward, then backward and past the end, on the same read
+        for page in [*range(1, 10), *range(9, 0, -1), 12]:
+            summary = _summarize_optimization("o-1", opt, page, 5)
+            self.assert_page_matches(summary, expected, page, 5)
+        assert "_ranked" in opt
+
+    def test_page_past_end_without_backtests(self):
+        """Test an optimization with no backtests has no best result"""
+        summary = _summarize_optimization("o-1", {"backtests": {}}, 2, 10)
+
+        assert summary["results"] == []
+        assert summary["best_result"] is None
+        assert summary["pagination"]["total_pages"] == 1
@@ -0,0 +1,98 @@
+"""Unit tests for the ai_trader Supabase client"""
+
+import httpx
+import pytest
+
+from graphs.ai_trader import supabase_client
+from graphs.ai_trader.supabase_client import SupabaseClient
+
+
+@pytest.fixture
+def supabase(monkeypatch):
+    """Route Supabase requests to a handler set by the test"""
+    monkeypatch.setenv("SUPABASE_URL", "https://supabase.test")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service-key")
+
+    state = {"handler": None, "requests": []}
+
+    def dispatch(request):
+        state["requests"].append(request)
+        return state["handler"](request)
+
+    monkeypatch.setattr(
+        supabase_client,
+        "_http_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(dispatch)),
+    )
+    return state
+
+
+class TestSelectWithCount:
+    """Test SupabaseClient.select_with_count"""
+
+    @pytest.mark.asyncio
+    async def test_total_from_content_range(self, supabase):
+        """Test the total comes from Content-Range, not the page size"""
+        rows = [{"id": i} for i in range(10)]
+        supabase["handler"] = lambda request: httpx.Response(
+            206, json=rows, headers={"Content-Range": "0-9/123"}
+        )
+
+        result = await SupabaseClient(use_service_role=True).select_with_count(
+            "code_versions", {"limit": "10", "offset": "0"}
+        )
+
+        assert result == (rows, 123)
+        request = supabase["requests"][0]
+        assert request.headers["Prefer"] == "count=exact"
+        assert request.url.params["limit"] == "10"
+
+    @pytest.mark.asyncio
+    async def test_no_matching_rows(self, supabase):
+        """Test an empty result reports a total of zero"""
+        supabase["handler"] = lambda request: httpx.Response(
+            200, json=[], headers={"Content-Range": "*/0"}
+        )
+
+        result = await SupabaseClient(use_service_role=True).select_with_count(
+            "code_versions"
+        )
+
+        assert result == ([], 0)
+
+    @pytest.mark.asyncio
+    async def test_offset_past_last_row(self, supabase):
+        """Test a 416 for an offset past the end returns no rows and the total"""
+        supabase["handler"] = lambda request: httpx.Response(
+            416,
+            json={"code": "PGRST103", "message": "Requested range not satisfiable"},
+            headers={"Content-Range": "*/42"},
+        )
+
+        result = await SupabaseClient(use_service_role=True).select_with_count(
+            "code_versions", {"limit": "10", "offset": "50"}
+        )
+
+        assert result == ([], 42)
+
+    @pytest.mark.asyncio
+    async def test_missing_content_range(self, supabase):
+        """Test the total falls back to the number of rows returned"""
+        rows = [{"id": 1}, {"id": 2}]
+        supabase["handler"] = lambda request: httpx.Response(200, json=rows)
+
+        result = await SupabaseClient(use_service_role=True).select_with_count(
+            "code_versions"
+        )
+
+        assert result == (rows, 2)
+
+    @pytest.mark.asyncio
+    async def test_other_errors_raise(self, supabase):
+        """Test error statuses other than 416 still raise"""
+        supabase["handler"] = lambda request: httpx.Response(500)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await SupabaseClient(use_service_role=True).select_with_count(
+                "code_versions"
+            )
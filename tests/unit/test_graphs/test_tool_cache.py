@@ -0,0 +1,277 @@
+"""Unit tests for the ai_trader tool cache"""
+
+import asyncio
+
+import pytest
+
+from graphs.ai_trader.tools import cache as cache_module
+from graphs.ai_trader.tools.cache import TTLCache, cache_key, cached, invalidate
+
+
+class FakeClock:
+    """Controllable stand-in for time.monotonic"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def clear_tool_cache():
+    cache_module.tool_cache.clear()
+    yield
+    cache_module.tool_cache.clear()
+
+
+class TestTTLCache:
+    """Test TTLCache class"""
+
+    def test_get_returns_stored_value(self, clock):
+        """Test a stored value is returned before it expires"""
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+
+        clock.now += 9
+        assert cache.get("a") == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test an entry is dropped once its TTL has passed"""
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+
+        clock.now += 10
+        assert cache.get("a") is None
+        assert "a" not in cache._data
+
+    def test_per_entry_ttl_overrides_default(self, clock):
+        """Test set() with ttl overrides the cache default"""
+        cache = TTLCache(ttl=10)
+        cache.set("short", 1, ttl=2)
+        cache.set("long", 2, ttl=60)
+
+        clock.now += 30
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_missing_key_returns_none(self):
+        """Test get() on an unknown key"""
+        assert TTLCache().get("missing") is None
+
+    def test_missing_key_returns_default(self, clock):
+        """Test get() returns default for unknown and expired keys"""
+        cache = TTLCache(ttl=10)
+        cache.set("none", None)
+        cache.set("old", 1)
+        marker = object()
+
+        assert cache.get("none", marker) is None
+        assert cache.get("missing", marker) is marker
+        clock.now += 10
+        assert cache.get("old", marker) is marker
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test the least recently used entry is evicted when full"""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # Reading "a" makes "b" the least recently used entry
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_invalidate_drops_prefix_and_nested_keys(self):
+        """Test invalidate() drops the key and keys nested under it"""
+        cache = TTLCache()
+        cache.set("list:org", 1)
+        cache.set("list:org:path", 2)
+        cache.set("list:organization", 3)
+        cache.set("other:org", 4)
+
+        cache.invalidate("list:org")
+
+        assert cache.get("list:org") is None
+        assert cache.get("list:org:path") is None
+        assert cache.get("list:organization") == 3
+        assert cache.get("other:org") == 4
+
+    def test_clear(self):
+        """Test clear() drops every entry"""
+        cache = TTLCache()
+        cache.set("a", 1)
+        cache.clear()
+
+        assert cache.get("a") is None
+
+
+class TestCacheHelpers:
+    """Test cache_key and invalidate helpers"""
+
+    def test_cache_key_joins_arguments(self):
+        """Test keys are built from the name and stringified arguments"""
+        assert cache_key("read", 1, "a") == "read:1:a"
+        assert cache_key("read") == "read"
+
+    def test_invalidate_uses_shared_cache(self):
+        """Test invalidate() drops entries from tool_cache"""
+        cache_module.tool_cache.set(cache_key("read", 1), "x")
+        cache_module.tool_cache.set(cache_key("read", 2), "y")
+
+        invalidate("read", 1)
+
+        assert cache_module.tool_cache.get(cache_key("read", 1)) is None
+        assert cache_module.tool_cache.get(cache_key("read", 2)) == "y"
+
+
+class TestCached:
+    """Test the cached decorator"""
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached(self):
+        """Test repeated calls with the same arguments hit the cache"""
+        calls = []
+
+        @cached("lookup")
+        async def lookup(key):
+            calls.append(key)
+            return {"key": key}
+
+        assert await lookup("a") == {"key": "a"}
+        assert await lookup("a") == {"key": "a"}
+        assert await lookup("b") == {"key": "b"}
+        assert calls == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_none_result_is_cached(self):
+        """Test a lookup returning None (e.g. "not found") is cached"""
+        calls = []
+
+        @cached("lookup")
+        async def lookup(key):
+            calls.append(key)
+            return None
+
+        assert await lookup("a") is None
+        assert await lookup("a") is None
+        assert calls == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_callable_ttl_receives_result(self, clock):
+        """Test a callable ttl is computed from the result"""
+
+        @cached("lookup", ttl=lambda value: value["ttl"])
+        async def lookup(ttl):
+            return {"ttl": ttl}
+
+        await lookup(5)
+        await lookup(50)
+
+        clock.now += 10
+        assert cache_module.tool_cache.get(cache_key("lookup", 5)) is None
+        assert cache_module.tool_cache.get(cache_key("lookup", 50)) == {"ttl": 50}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_lookup(self):
+        """Test concurrent cache misses for one key run the lookup once"""
+        calls = []
+        release = asyncio.Event()
+
+        @cached("lookup")
+        async def lookup(key):
+            calls.append(key)
+            await release.wait()
+            return {"key": key}
+
+        tasks = [asyncio.ensure_future(lookup("a")) for _ in range(3)]
+        tasks.append(asyncio.ensure_future(lookup("b")))
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks)
+
+        assert results == [{"key": "a"}] * 3 + [{"key": "b"}]
+        assert sorted(calls) == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        """Test a failed lookup is shared by concurrent callers but retried later"""
+        calls = []
+        release = asyncio.Event()
+
+        @cached("lookup")
+        async def lookup(key):
+            calls.append(key)
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.ensure_future(lookup("a")) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert calls == ["a"]
+
+        with pytest.raises(ValueError):
+            await lookup("a")
+        assert calls == ["a", "a"]
+        assert cache_module.tool_cache.get(cache_key("lookup", "a")) is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test cancelling one caller leaves the shared lookup running"""
+        release = asyncio.Event()
+
+        @cached("lookup")
+        async def lookup(key):
+            await release.wait()
+            return {"key": key}
+
+        first = asyncio.ensure_future(lookup("a"))
+        second = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == {"key": "a"}
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_detaches_running_lookup(self):
+        """Test a lookup running during invalidate() does not store its result"""
+        calls = []
+        release = asyncio.Event()
+
+        @cached("lookup")
+        async def lookup(key):
+            calls.append(key)
+            version = len(calls)
+            await release.wait()
+            return {"version": version}
+
+        stale = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+
+        # A write lands while the first read is still running
+        invalidate("lookup", "a")
+        fresh = asyncio.ensure_future(lookup("a"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await stale == {"version": 1}
+        assert await fresh == {"version": 2}
+        assert calls == ["a", "a"]
+        assert cache_module.tool_cache.get(cache_key("lookup", "a")) == {"version": 2}